@@ -6,11 +6,44 @@ A straightforward PDF processing script for generating text, JSON, and markdown
 import os
 import sys
 import json
+import mmap
+import re
 import uuid
 import argparse
+from collections import defaultdict
+import numpy as np
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+try:
+    # Much faster JSON encoder for the multi-MB chunk and collection files
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # SIMD JSON parser; one parser is reused so its buffers are recycled
+    import simdjson
+    _json_parser = simdjson.Parser()
+except ImportError:
+    simdjson = None
+
+def dump_json(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+def load_json(path):
+    """Load a JSON file, using simdjson when available"""
+    if simdjson is not None:
+        # Build plain Python objects so the parser is free for the next file
+        return _json_parser.load(str(path), recursive=True)
+    with open(path, 'r', encoding="utf-8") as f:
+        return json.load(f)
+
 def get_file_info(file_path):
     """Get detailed information about a file"""
     stats = file_path.stat()
@@ -21,55 +54,79 @@ def get_file_info(file_path):
         'modified': mod_time
     }
 
-def get_processed_info(name, chunks_dir, docs_dir, ollama_dir):
-    """Get information about processed files"""
+def scan_dir(directory):
+    """Index a directory's entries by file name with a single scandir pass"""
+    with os.scandir(directory) as entries:
+        return {entry.name: entry for entry in entries}
+
+def size_mb(entry):
+    """Size of a scanned directory entry in MB"""
+    return round(entry.stat().st_size / (1024 * 1024), 2)
+
+# Bytes scanned per step when counting lines, to bound the temporary arrays
+_COUNT_BLOCK_SIZE = 1 << 20
+
+def count_lines(text_file):
+    """Count lines by scanning a memory map of the file for line break bytes
+
+    Follows text-mode iteration: \n, \r\n and a lone \r each end a line.
+    """
+    with map_text_file(text_file) as mm:
+        size = len(mm)
+        if size == 0:
+            return 0
+        lines = 0
+        for start in range(0, size, _COUNT_BLOCK_SIZE):
+            end = min(start + _COUNT_BLOCK_SIZE, size)
+            # One byte past the block, to see a \r\n split across blocks
+            data = np.frombuffer(mm, dtype=np.uint8, count=min(end + 1, size) - start, offset=start)
+            lf = data == ord("\n")
+            cr = data == ord("\r")
+            lines += int(np.count_nonzero(lf[:end - start])) + int(np.count_nonzero(cr[:end - start]))
+            lines -= int(np.count_nonzero(cr[:-1] & lf[1:]))  # \r\n is one break
+            del data, lf, cr  # Release the buffer before the map is closed
+        # A final line without a trailing line break still counts
+        if mm[-1] not in (ord("\n"), ord("\r")):
+            lines += 1
+        return lines
+
+def get_doc_entries(name, indices):
+    """Get the scanned entries for a document's own output folder"""
+    doc_entry = indices['docs'].get(name)
+    if doc_entry is not None and doc_entry.is_dir():
+        return scan_dir(doc_entry.path)
+
+    # Check old text file structure for backward compatibility
+    text_entry = indices['docs'].get(f"{name}.txt")
+    return {text_entry.name: text_entry} if text_entry is not None else {}
+
+def get_processed_sizes(name, indices, doc_entries):
+    """Get the sizes of processed files (metadata only, no file reads)"""
     info = {}
+    entries = {
+        'text_size_mb': doc_entries.get(f"{name}.txt"),
+        'json_size_mb': doc_entries.get(f"{name}.json"),
+        'md_size_mb': doc_entries.get(f"{name}.md"),
+        'ollama_size_mb': indices['ollama'].get(f"{name}_ollama.jsonl")
+    }
+    for key, entry in entries.items():
+        if entry is not None:
+            info[key] = size_mb(entry)
+    return info
 
-    # Check chunks file
-    chunks_file = chunks_dir / f"{name}_chunks.json"
-    if chunks_file.exists():
-        with open(chunks_file, 'r', encoding="utf-8") as f:
-            chunks = json.load(f)
-            info['chunks_count'] = len(chunks)
+def get_detailed_info(name, indices, doc_entries):
+    """Get chunk and line counts for processed files (reads the files)"""
+    info = {}
 
-    # Check individual document directory
-    doc_dir = docs_dir / name
-    if doc_dir.exists():
-        # Check text file
-        text_file = doc_dir / f"{name}.txt"
-        if text_file.exists():
-            info['text_size_mb'] = round(text_file.stat().st_size / (1024 * 1024), 2)
-            with open(text_file, 'r', encoding="utf-8") as f:
-                info['text_lines'] = sum(1 for _ in f)
-
-        # Check JSON file
-        json_file = doc_dir / f"{name}.json"
-        if json_file.exists():
-            info['json_size_mb'] = round(json_file.stat().st_size / (1024 * 1024), 2)
-
-        # Check Markdown file
-        md_file = doc_dir / f"{name}.md"
-        if md_file.exists():
-            info['md_size_mb'] = round(md_file.stat().st_size / (1024 * 1024), 2)
-    else:
-        # Check old text file structure for backward compatibility
-        text_file = docs_dir / f"{name}.txt"
-        if text_file.exists():
-            info['text_size_mb'] = round(text_file.stat().st_size / (1024 * 1024), 2)
-            with open(text_file, 'r', encoding="utf-8") as f:
-                info['text_lines'] = sum(1 for _ in f)
-
-    # Check Ollama file
-    ollama_file = ollama_dir / f"{name}_ollama.jsonl"
-    if ollama_file.exists():
-        info['ollama_size_mb'] = round(ollama_file.stat().st_size / (1024 * 1024), 2)
+    chunks_entry = indices['chunks'].get(f"{name}_chunks.json")
+    if chunks_entry is not None:
+        info['chunks_count'] = len(load_json(chunks_entry.path))
 
-    return info
+    text_entry = doc_entries.get(f"{name}.txt")
+    if text_entry is not None:
+        info['text_lines'] = count_lines(text_entry.path)
 
-def is_pdf_processed(pdf_name, chunks_dir):
-    """Check if a PDF has already been processed"""
-    chunk_file = chunks_dir / f"{pdf_name}_chunks.json"
-    return chunk_file.exists()
+    return info
 
 def prepare_openwebui_collection(chunks_dir, output_dir, collection_name="Document Knowledge Base"):
     """Prepare chunks for Open WebUI collection"""
@@ -80,32 +137,35 @@ def prepare_openwebui_collection(chunks_dir, output_dir, collection_name="Docume
     openwebui_dir.mkdir(parents=True, exist_ok=True)
     output_file = openwebui_dir / "knowledge_collection.json"
 
-    # Load all chunks
-    all_chunks = []
+    # Load all chunks, grouping them by document source as they are read
+    docs_by_source = defaultdict(list)
+    total_chunks = 0
     chunk_files = list(chunks_dir.glob("*_chunks.json"))
 
     for chunk_file in chunk_files:
+        # Parse and check the whole file before merging any of it, so a
+        # malformed chunk can't leave a partial document in the collection
         try:
-            with open(chunk_file, "r", encoding="utf-8") as f:
-                chunks = json.load(f)
-                all_chunks.extend(chunks)
-                print(f"Loaded {len(chunks)} chunks from {chunk_file.name}")
+            chunks = load_json(chunk_file)
+            sourced_chunks = []
+            for chunk in chunks:
+                if not isinstance(chunk["text"], str):
+                    raise ValueError("chunk text is not a string")
+                sourced_chunks.append((chunk["metadata"]["source"], chunk))
         except Exception as e:
             print(f"Error loading {chunk_file}: {str(e)}")
+            continue
 
-    if not all_chunks:
+        for source, chunk in sourced_chunks:
+            docs_by_source[source].append(chunk)
+        total_chunks += len(chunks)
+        print(f"Loaded {len(chunks)} chunks from {chunk_file.name}")
+
+    if not total_chunks:
         print("No chunks found for Open WebUI collection")
         return
 
-    print(f"Loaded {len(all_chunks)} total chunks")
-
-    # Group chunks by document source
-    docs_by_source = {}
-    for chunk in all_chunks:
-        source = chunk["metadata"]["source"]
-        if source not in docs_by_source:
-            docs_by_source[source] = []
-        docs_by_source[source].append(chunk)
+    print(f"Loaded {total_chunks} total chunks")
 
     # Create Open WebUI collection structure
     collection = {
@@ -115,7 +175,9 @@ def prepare_openwebui_collection(chunks_dir, output_dir, collection_name="Docume
 
     # Process each document
     for source, doc_chunks in docs_by_source.items():
-        doc_id = str(uuid.uuid4())
+        # Draw random bytes for the document and all of its chunk IDs at once
+        raw_ids = os.urandom(16 * (len(doc_chunks) + 1))
+        doc_id = str(uuid.UUID(bytes=raw_ids[:16], version=4))
         document = {
             "id": doc_id,
             "url": "",
@@ -125,7 +187,8 @@ def prepare_openwebui_collection(chunks_dir, output_dir, collection_name="Docume
 
         # Add chunks for this document
         for i, chunk in enumerate(doc_chunks):
-            chunk_id = str(uuid.uuid4())
+            offset = 16 * (i + 1)
+            chunk_id = str(uuid.UUID(bytes=raw_ids[offset:offset + 16], version=4))
             document["content_chunks"].append({
                 "id": chunk_id,
                 "doc_id": doc_id,
@@ -140,8 +203,7 @@ def prepare_openwebui_collection(chunks_dir, output_dir, collection_name="Docume
         collection["documents"].append(document)
 
     # Save to file
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(collection, f, ensure_ascii=False, indent=2)
+    output_file.write_bytes(dump_json(collection, indent=True))
 
     print(f"Created Open WebUI collection with {len(collection['documents'])} documents")
     print(f"Saved to {output_file}")
@@ -167,10 +229,144 @@ You can now use this collection in your RAG workflows in Open WebUI.
 
     print(f"Import instructions saved to {instructions_file}")
 
-def generate_markdown(text, title, page_count, pdf_filename, processed_date):
-    """Generate a nicely formatted markdown version of the document"""
+@contextmanager
+def open_pdf_pages(pdf_file):
+    """Open a PDF for text extraction, yielding (page_count, iterator over page texts)
+
+    The reader works on a memory map of the file, so pages are served from the
+    page cache instead of PyPDF2 reading the whole file into memory first. The
+    map is closed when the with-block exits, however it exits.
+    """
+    import PyPDF2
+    with open(pdf_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise PyPDF2.errors.EmptyFileError("Cannot read an empty file")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with mm:
+        pages = PyPDF2.PdfReader(mm).pages
+        yield len(pages), (page.extract_text() for page in pages)
+
+@contextmanager
+def map_text_file(text_file):
+    """Memory map a text file for reading; an empty file maps to empty bytes"""
+    with open(text_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+# Runs of two or more line breaks end a paragraph
+_PARAGRAPH_BREAK_RE = re.compile(rb"\n\n+")
+
+def iter_paragraphs(data):
+    """Decode UTF-8 text one paragraph at a time from a buffer such as a memory map
+
+    Each paragraph keeps the line breaks that end it, so the paragraphs join
+    back into the full text.
+    """
+    start = 0
+    for match in _PARAGRAPH_BREAK_RE.finditer(data):
+        yield str(data[start:match.end()], "utf-8")
+        start = match.end()
+    if start < len(data):
+        yield str(data[start:], "utf-8")
+
+def _split_paragraphs(paragraphs, chunk_size, piece_size):
+    """Yield paragraphs, breaking up those that can't fit in a single chunk
+
+    Long paragraphs are split at line breaks or spaces where possible, into
+    pieces of up to piece_size characters.
+    """
+    for paragraph in paragraphs:
+        start = 0
+        while len(paragraph) - start > chunk_size:
+            cut = paragraph.rfind("\n", start + 1, start + piece_size)
+            if cut < 0:
+                cut = paragraph.rfind(" ", start + 1, start + piece_size)
+            cut = start + piece_size if cut < 0 else cut + 1
+            yield paragraph[start:cut]
+            start = cut
+        yield paragraph[start:]
+
+def chunk_paragraphs(paragraphs, chunk_size=1000, overlap=1, overlap_chars=100):
+    """Split text into chunks of whole paragraphs of up to chunk_size characters
+
+    Takes the text as an iterable of paragraphs (see iter_paragraphs) and
+    yields the chunks, reading only as far ahead as the next chunk needs.
+    Consecutive chunks share up to `overlap` paragraphs. When no whole
+    paragraph fits, they share roughly the last `overlap_chars` characters
+    instead, starting at a line break or space. Paragraphs longer than
+    chunk_size are split at line breaks or spaces where possible, into pieces
+    that leave room for that overlap.
+    """
+    pieces = _split_paragraphs(paragraphs, chunk_size, max(1, chunk_size - overlap_chars))
+
+    # Offsets are into the whole text, but only the text from chunk_start on
+    # is kept in `window`, and only the spans from the chunk's first
+    # paragraph on are kept in `spans`
+    piece = next(pieces, None)
+    if piece is None:
+        return
+    spans = [(0, len(piece))]
+    window = piece
+    chunk_start = 0
+    read_end = len(piece)
+
+    while True:
+        # Greedily pack paragraphs into the chunk, reading more as needed
+        last = 0
+        while True:
+            if last + 1 == len(spans):
+                piece = next(pieces, None)
+                if piece is None:
+                    break
+                spans.append((read_end, read_end + len(piece)))
+                window += piece
+                read_end += len(piece)
+            if spans[last + 1][1] - chunk_start > chunk_size:
+                break
+            last += 1
+        chunk_end = spans[last][1]
+        chunk = window[:chunk_end - chunk_start]
+        if chunk.strip():
+            yield chunk
+        if last + 1 == len(spans):
+            break
+
+        # Carry trailing paragraphs over to the next chunk, as long as they
+        # still fit alongside the next new paragraph
+        next_first = last + 1
+        while (next_first - 1 > 0 and next_first > last + 1 - overlap
+               and spans[last + 1][1] - spans[next_first - 1][0] <= chunk_size):
+            next_first -= 1
+
+        if next_first <= last:
+            next_start = spans[next_first][0]
+        else:
+            # No whole paragraph fits, so carry a tail of characters instead,
+            # starting after the first line break or space in it
+            tail_start = max(chunk_end - overlap_chars,
+                             spans[last + 1][1] - chunk_size,
+                             chunk_start + 1)
+            breaks = [i for i in (window.find("\n", tail_start - chunk_start, chunk_end - chunk_start),
+                                  window.find(" ", tail_start - chunk_start, chunk_end - chunk_start))
+                      if i >= 0]
+            next_start = chunk_start + min(breaks) + 1 if breaks else tail_start
+        window = window[next_start - chunk_start:]
+        chunk_start = next_start
+        del spans[:next_first]
+
+# Lines that start like a bullet or numbered list item
+_LIST_ITEM_RE = re.compile(r"^\s*(?:[•*-]|[12]\.)", re.MULTILINE)
+
+def generate_markdown(paragraphs, title, page_count, pdf_filename, processed_date):
+    """Generate a nicely formatted markdown version of the document, piece by piece
+
+    Takes the text as an iterable of paragraphs (see iter_paragraphs).
+    """
     # Create a header with metadata
-    markdown = f"""# {title}
+    yield f"""# {title}
 
 **Source**: {pdf_filename}
 **Pages**: {page_count}
@@ -181,35 +377,131 @@ def generate_markdown(text, title, page_count, pdf_filename, processed_date):
 """
 
     # Process the text to create a more readable markdown version
-    # Split text into paragraphs
-    paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-
     # Heuristic to identify potential headings
-    for paragraph in paragraphs:
+    for paragraph in map(str.strip, paragraphs):
+        if not paragraph:
+            continue
+
         # Check if paragraph looks like a heading (short, ends with colon, all caps, etc.)
-        lines = paragraph.split('\n')
-        if len(lines) == 1 and len(paragraph) < 100:
-            if paragraph.isupper() or paragraph.endswith(':') or paragraph.endswith('.'):
+        if '\n' not in paragraph and len(paragraph) < 100:
+            if paragraph.isupper() or paragraph.endswith((':', '.')):
                 # Likely a heading
                 if len(paragraph) < 50:  # Short heading
-                    markdown += f"## {paragraph}\n\n"
+                    yield f"## {paragraph}\n\n"
                 else:  # Longer heading/subheading
-                    markdown += f"### {paragraph}\n\n"
+                    yield f"### {paragraph}\n\n"
             else:
                 # Regular paragraph
-                markdown += f"{paragraph}\n\n"
+                yield f"{paragraph}\n\n"
         else:
             # Multi-line paragraph, check if it's a list
-            if any(line.strip().startswith(('•', '-', '*', '1.', '2.')) for line in lines):
+            lines = paragraph.split('\n')
+            if _LIST_ITEM_RE.search(paragraph):
                 # Format as a list
                 for line in lines:
-                    markdown += f"{line}\n"
-                markdown += "\n"
+                    yield f"{line}\n"
+                yield "\n"
             else:
                 # Regular multi-line paragraph
-                markdown += f"{' '.join(lines)}\n\n"
+                yield f"{' '.join(lines)}\n\n"
+
+def _process_one_pdf(pdf_file, dirs):
+    """Process a single PDF and return its file info (runs in a worker process)"""
+    docs_dir, chunks_dir, ollama_dir = dirs
+    file_info = {'name': pdf_file.name, **get_file_info(pdf_file)}
+    name = pdf_file.stem
+
+    # Create individual document directory
+    doc_dir = docs_dir / name
+    text_file = doc_dir / f"{name}.txt"
+    chunks_file = chunks_dir / f"{name}_chunks.json"
 
-    return markdown
+    try:
+        print(f"Processing {pdf_file.name}")
+
+        # Stream each page's text straight into the text file, so only one
+        # page is held in memory at a time
+        with open_pdf_pages(pdf_file) as (page_count, pages):
+            file_info['pages'] = page_count
+
+            # Create document directory if it doesn't exist
+            doc_dir.mkdir(parents=True, exist_ok=True)
+
+            with open(text_file, "w", encoding="utf-8") as f:
+                for page_text in pages:
+                    f.write(page_text)
+                    f.write("\n\n")
+
+        processed_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        # The markdown and chunks are built from a memory map of the text
+        # file, decoded one paragraph at a time
+        with map_text_file(text_file) as text_data:
+            # Generate markdown version
+            with open(doc_dir / f"{name}.md", "w", encoding="utf-8") as f:
+                f.writelines(generate_markdown(
+                    iter_paragraphs(text_data),
+                    name,
+                    page_count,
+                    pdf_file.name,
+                    processed_date
+                ))
+
+            # Create chunks of whole paragraphs (up to 1000 chars each,
+            # overlapping by one paragraph). Every chunk records the total,
+            # so count them first rather than holding them all in memory
+            total_chunks = sum(1 for _ in chunk_paragraphs(iter_paragraphs(text_data), chunk_size=1000))
+
+            # Save chunks (one chunk per line) and the Ollama file together,
+            # encoding each chunk once for both
+            with open(chunks_file, "wb") as chunks_f, \
+                    open(ollama_dir / f"{name}_ollama.jsonl", "wb") as ollama_f:
+                chunks_f.write(b"[\n")
+                chunk_texts = chunk_paragraphs(iter_paragraphs(text_data), chunk_size=1000)
+                for i, chunk in enumerate(chunk_texts):
+                    line = dump_json({
+                        "text": chunk,
+                        "metadata": {
+                            "source": pdf_file.name,
+                            "chunk_index": i,
+                            "total_chunks": total_chunks
+                        }
+                    })
+                    if i:
+                        chunks_f.write(b",\n")
+                    chunks_f.write(line)
+                    ollama_f.write(line)
+                    ollama_f.write(b"\n")
+                chunks_f.write(b"\n]\n")
+
+        # Save JSON metadata in document folder
+        with open(doc_dir / f"{name}.json", "wb") as f:
+            f.write(dump_json({
+                "title": name,
+                "source": pdf_file.name,
+                "pages": page_count,
+                "processed_date": processed_date,
+                "chunks_count": total_chunks,
+                "text_path": f"{name}.txt"
+            }, indent=True))
+
+        print(f"Successfully processed {pdf_file.name}")
+        print(f"Files saved in folder: {doc_dir}")
+        file_info['status'] = 'processed'
+        file_info['chunks_count'] = total_chunks
+        file_info['text_lines'] = count_lines(text_file)
+
+    except Exception as e:
+        print(f"Error with {pdf_file.name}: {e}")
+        file_info['status'] = 'error'
+        file_info['error'] = str(e)
+
+        # Outputs are written as they are built, so remove a partial text or
+        # chunks file; the PDF is then not taken as processed on the next run
+        text_file.unlink(missing_ok=True)
+        chunks_file.unlink(missing_ok=True)
+
+    return file_info
 
 def process_pdfs(force_reprocess=False, skip_openwebui=False):
     """Process PDFs using a very simple approach"""
@@ -219,7 +511,6 @@ def process_pdfs(force_reprocess=False, skip_openwebui=False):
     except ImportError:
         print("Installing PyPDF2...")
         os.system(f"{sys.executable} -m pip install PyPDF2")
-        import PyPDF2
 
     # Use relative paths for portability
     script_dir = Path(__file__).parent.absolute()
@@ -241,99 +532,70 @@ def process_pdfs(force_reprocess=False, skip_openwebui=False):
     skipped_count = 0
     file_details = []
 
-    # Process each PDF
-    for pdf_file in pdf_files:
-        file_info = {'name': pdf_file.name, **get_file_info(pdf_file)}
-        name = pdf_file.stem
-
-        # Create individual document directory
-        doc_dir = docs_dir / name
+    # List already processed PDFs with one directory read
+    processed_stems = {
+        entry.name[:-len("_chunks.json")]
+        for entry in os.scandir(chunks_dir)
+        if entry.name.endswith("_chunks.json")
+    }
 
-        if not force_reprocess and is_pdf_processed(name, chunks_dir):
+    # Skipped PDFs are handled here; only the rest go to worker processes
+    results = {}
+    to_process = []
+    for pdf_file in pdf_files:
+        if not force_reprocess and pdf_file.stem in processed_stems:
             print(f"Skipping {pdf_file.name} - already processed")
-            file_info['status'] = 'skipped'
-            file_info.update(get_processed_info(name, chunks_dir, docs_dir, ollama_dir))
-            skipped_count += 1
+            results[pdf_file] = {'name': pdf_file.name, **get_file_info(pdf_file), 'status': 'skipped'}
         else:
-            try:
-                print(f"Processing {pdf_file.name}")
-
-                # Extract text
-                reader = PyPDF2.PdfReader(str(pdf_file))
-                file_info['pages'] = len(reader.pages)
-
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n\n"
-
-                # Create document directory if it doesn't exist
-                doc_dir.mkdir(parents=True, exist_ok=True)
-
-                # Save full text in document folder
-                with open(doc_dir / f"{name}.txt", "w", encoding="utf-8") as f:
-                    f.write(text)
-
-                # Generate and save markdown version
-                processed_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                markdown_content = generate_markdown(
-                    text,
-                    name,
-                    len(reader.pages),
-                    pdf_file.name,
-                    processed_date
-                )
-                with open(doc_dir / f"{name}.md", "w", encoding="utf-8") as f:
-                    f.write(markdown_content)
-
-                # Create basic chunks (500 chars each with 50 char overlap)
-                chunks = []
-                chunk_size = 1000
-                overlap = 100
-
-                # Simple chunking by characters with overlap
-                for i in range(0, len(text), chunk_size - overlap):
-                    chunk = text[i:i + chunk_size]
-                    if chunk:  # Only add non-empty chunks
-                        chunks.append({
-                            "text": chunk,
-                            "metadata": {
-                                "source": pdf_file.name,
-                                "chunk_index": len(chunks),
-                                "total_chunks": (len(text) // (chunk_size - overlap)) + 1
-                            }
-                        })
-
-                # Save chunks
-                with open(chunks_dir / f"{name}_chunks.json", "w", encoding="utf-8") as f:
-                    json.dump(chunks, f, indent=2)
-
-                # Save JSON in document folder
-                with open(doc_dir / f"{name}.json", "w", encoding="utf-8") as f:
-                    json.dump({
-                        "title": name,
-                        "source": pdf_file.name,
-                        "pages": len(reader.pages),
-                        "processed_date": processed_date,
-                        "chunks_count": len(chunks),
-                        "full_text": text
-                    }, f, indent=2)
-
-                # Save for Ollama
-                with open(ollama_dir / f"{name}_ollama.jsonl", "w", encoding="utf-8") as f:
-                    for chunk in chunks:
-                        f.write(json.dumps(chunk) + "\n")
-
-                print(f"Successfully processed {pdf_file.name}")
-                print(f"Files saved in folder: {doc_dir}")
-                file_info['status'] = 'processed'
-                file_info.update(get_processed_info(name, chunks_dir, docs_dir, ollama_dir))
-                processed_count += 1
-
-            except Exception as e:
-                print(f"Error with {pdf_file.name}: {e}")
-                file_info['status'] = 'error'
-                file_info['error'] = str(e)
+            to_process.append(pdf_file)
+
+    # Process PDFs in parallel; each one writes to its own output files
+    if to_process:
+        dirs = (docs_dir, chunks_dir, ollama_dir)
+        max_workers = min(os.cpu_count() or 1, len(to_process))
+        sys.stdout.flush()  # Don't let forked workers inherit unflushed output
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_process_one_pdf, pdf_file, dirs): pdf_file
+                for pdf_file in to_process
+            }
+            for future in as_completed(futures):
+                pdf_file = futures[future]
+                try:
+                    results[pdf_file] = future.result()
+                except Exception as e:
+                    # A worker died (e.g. BrokenProcessPool after an OOM kill);
+                    # record the failure and keep the other results
+                    error = str(e) or type(e).__name__
+                    print(f"Error with {pdf_file.name}: {error}")
+                    results[pdf_file] = {
+                        'name': pdf_file.name,
+                        **get_file_info(pdf_file),
+                        'status': 'error',
+                        'error': error
+                    }
+
+    # Scan each output directory once rather than checking files one by one
+    indices = {
+        'docs': scan_dir(docs_dir),
+        'chunks': scan_dir(chunks_dir),
+        'ollama': scan_dir(ollama_dir)
+    }
 
+    # Keep the summary in the original file order
+    for pdf_file in pdf_files:
+        file_info = results[pdf_file]
+        if file_info['status'] == 'processed':
+            processed_count += 1
+        elif file_info['status'] == 'skipped':
+            skipped_count += 1
+        if file_info['status'] != 'error':
+            doc_entries = get_doc_entries(pdf_file.stem, indices)
+            file_info.update(get_processed_sizes(pdf_file.stem, indices, doc_entries))
+            # Newly processed PDFs already report their counts; only skipped
+            # ones need their output files read back
+            if file_info['status'] == 'skipped':
+                file_info.update(get_detailed_info(pdf_file.stem, indices, doc_entries))
         file_details.append(file_info)
 
     # Print detailed summary
@@ -40,9 +40,10 @@ def process_pdfs():
 
             # Extract text
             reader = PyPDF2.PdfReader(str(pdf_file))
-            text = ""
+            pages_text = []
             for page in reader.pages:
-                text += page.extract_text() + "\n\n"
+                pages_text.append(page.extract_text())
+            text = "".join(page_text + "\n\n" for page_text in pages_text)
 
             # Save full text
             name = pdf_file.stem
@@ -62,11 +63,14 @@ def process_pdfs():
                         "text": chunk,
                         "metadata": {
                             "source": pdf_file.name,
-                            "chunk_index": len(chunks),
-                            "total_chunks": (len(text) // (chunk_size - overlap)) + 1
+                            "chunk_index": len(chunks)
                         }
                     })
 
+            # Record the actual number of chunks on each one
+            for chunk in chunks:
+                chunk["metadata"]["total_chunks"] = len(chunks)
+
             # Save chunks
             with open(chunks_dir / f"{name}_chunks.json", "w", encoding="utf-8") as f:
                 json.dump(chunks, f, indent=2)